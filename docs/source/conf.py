@@ -199,7 +199,6 @@ intersphinx_mapping = {
     "pandas": ("https://pandas.pydata.org/pandas-docs/stable/", None),
     "tables": ("https://www.pytables.org/", None),
     "numpy": ("https://numpy.org/doc/stable/", None),
-    "networkx": ("https://networkx.org/documentation/stable/", None),
 }
 
 
@@ -35,7 +35,6 @@ if __name__ == "__main__":
         "scipy",
         "click",
         "tables",
-        "networkx",
         "loguru",
     ]
 
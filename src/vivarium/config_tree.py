@@ -36,6 +36,9 @@ import yaml
 
 from vivarium.exceptions import VivariumError
 
+# Use the libyaml backed loader when PyYAML was built against it.
+_YAML_LOADER = getattr(yaml, "CFullLoader", yaml.FullLoader)
+
 
 class ConfigurationError(VivariumError):
     """Base class for configuration errors."""
@@ -443,12 +446,10 @@ class ConfigTree:
             data, Path
         ):
             source = source if source else str(data)
-            with open(data) as f:
-                data = f.read()
-            data = yaml.full_load(data)
+            data = load_yaml(data)
             return data, source
         elif isinstance(data, str):
-            data = yaml.full_load(data)
+            data = yaml.load(data, Loader=_YAML_LOADER)
             return data, source
         elif isinstance(data, ConfigTree):
             return data.to_dict(), source
@@ -574,3 +575,21 @@ class ConfigTree:
                 for name, c in self._children.items()
             ]
         )
+
+
+def load_yaml(path: Union[str, Path]) -> Any:
+    """Loads the data in a yaml file.
+
+    Parameters
+    ----------
+    path
+        The path to the yaml file.
+
+    Returns
+    -------
+    Any
+        The data in the yaml file.
+
+    """
+    with open(path) as f:
+        return yaml.load(f, Loader=_YAML_LOADER)
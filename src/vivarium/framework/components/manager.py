@@ -17,7 +17,9 @@ setup everything it holds when the context itself is setup.
 """
 import inspect
 import typing
-from typing import Any, Dict, Iterator, List, Tuple, Type, Union
+from collections import defaultdict
+from types import MappingProxyType
+from typing import Any, Iterator, List, Mapping, Tuple, Type, Union
 
 from vivarium.config_tree import ConfigurationError, DuplicatedConfigurationError
 from vivarium.exceptions import VivariumError
@@ -42,15 +44,35 @@ class OrderedComponentSet:
 
     def __init__(self, *args):
         self.components = []
+        # Name index for constant time membership tests and lookups.
+        self._by_name = {}
+        self._by_name_view = MappingProxyType(self._by_name)
         if args:
             self.update(args)
 
+    @property
+    def by_name(self) -> Mapping[str, Any]:
+        """A read-only, live mapping of component names to components."""
+        return self._by_name_view
+
+    def get(self, name: str) -> Any:
+        """Get the component with name ``name``.
+
+        Raises
+        ------
+        KeyError
+            No component in the set has name ``name``.
+
+        """
+        return self._by_name[name]
+
     def add(self, component: Any):
         if component in self:
             raise ComponentConfigError(
                 f"Attempting to add a component with duplicate name: {component}"
             )
         self.components.append(component)
+        self._by_name[component.name] = component
 
     def update(self, components: Union[List[Any], Tuple[Any]]):
         for c in components:
@@ -58,12 +80,13 @@ class OrderedComponentSet:
 
     def pop(self) -> Any:
         component = self.components.pop(0)
+        del self._by_name[component.name]
         return component
 
     def __contains__(self, component: Any) -> bool:
         if not hasattr(component, "name"):
             raise ComponentConfigError(f"Component {component} has no name attribute")
-        return component.name in [c.name for c in self.components]
+        return component.name in self._by_name
 
     def __iter__(self) -> Iterator:
         return iter(self.components)
@@ -78,12 +101,9 @@ class OrderedComponentSet:
         return OrderedComponentSet(*(self.components + other.components))
 
     def __eq__(self, other: "OrderedComponentSet") -> bool:
-        try:
-            return type(self) is type(other) and [c.name for c in self.components] == [
-                c.name for c in other.components
-            ]
-        except TypeError:
-            return False
+        # The name index preserves insertion order, so comparing its keys
+        # compares the ordered component names.
+        return type(self) is type(other) and list(self.by_name) == list(other.by_name)
 
     def __getitem__(self, index: int) -> Any:
         return self.components[index]
@@ -112,6 +132,9 @@ class ComponentManager:
     def __init__(self):
         self._managers = OrderedComponentSet()
         self._components = OrderedComponentSet()
+        # Components indexed by every class in their MRO, in insertion order.
+        self._components_by_type = defaultdict(list)
+        self._frozen = False
         self.configuration = None
         self.lifecycle = None
 
@@ -147,9 +170,11 @@ class ComponentManager:
             Instantiated managers to register.
 
         """
+        apply_configuration_defaults = self.apply_configuration_defaults
+        add_manager = self._managers.add
         for m in self._flatten(managers):
-            self.apply_configuration_defaults(m)
-            self._managers.add(m)
+            apply_configuration_defaults(m)
+            add_manager(m)
 
     def add_components(self, components: Union[List[Any], Tuple[Any]]):
         """Register new components with the component manager.
@@ -161,10 +186,24 @@ class ComponentManager:
         components
             Instantiated components to register.
 
+        Raises
+        ------
+        ComponentConfigError
+            If components are added after the component manager is set up.
+
         """
+        if self._frozen:
+            raise ComponentConfigError(
+                "Components cannot be added after the component manager has been set up."
+            )
+        apply_configuration_defaults = self.apply_configuration_defaults
+        add_component = self._components.add
+        components_by_type = self._components_by_type
         for c in self._flatten(components):
-            self.apply_configuration_defaults(c)
-            self._components.add(c)
+            apply_configuration_defaults(c)
+            add_component(c)
+            for component_type in type(c).__mro__:
+                components_by_type[component_type].append(c)
 
     def get_components_by_type(
         self, component_type: Union[type, Tuple[type, ...]]
@@ -182,6 +221,11 @@ class ComponentManager:
             A list of components of type ``component_type``.
 
         """
+        # The index only reflects real subclassing, so tuples of types and
+        # types with a custom metaclass (e.g. abstract base classes, which
+        # may have registered virtual subclasses) need a full isinstance scan.
+        if type(component_type) is type and component_type in self._components_by_type:
+            return list(self._components_by_type[component_type])
         return [c for c in self._components if isinstance(c, component_type)]
 
     def get_component(self, name: str) -> Any:
@@ -205,21 +249,21 @@ class ComponentManager:
             No component exists in the component manager with ``name``.
 
         """
-        for c in self._components:
-            if c.name == name:
-                return c
-        raise ValueError(f"No component found with name {name}")
+        try:
+            return self._components.get(name)
+        except KeyError:
+            raise ValueError(f"No component found with name {name}")
 
-    def list_components(self) -> Dict[str, Any]:
+    def list_components(self) -> Mapping[str, Any]:
         """Get a mapping of component names to components held by the manager.
 
         Returns
         -------
-        Dict[str, Any]
-            A mapping of component names to components.
+        Mapping[str, Any]
+            A read-only mapping of component names to components.
 
         """
-        return {c.name: c for c in self._components}
+        return self._components.by_name
 
     def setup_components(self, builder: "Builder"):
         """Separately configure and set up the managers and components held by
@@ -237,13 +281,16 @@ class ComponentManager:
 
         """
         self._setup_components(builder, self._managers + self._components)
+        self._freeze()
 
     def apply_configuration_defaults(self, component: Any):
-        if not hasattr(component, "configuration_defaults"):
+        configuration_defaults = getattr(component, "configuration_defaults", None)
+        if not configuration_defaults:
+            # Nothing to merge, so skip walking the configuration tree.
             return
         try:
             self.configuration.update(
-                component.configuration_defaults,
+                configuration_defaults,
                 layer="component_configs",
                 source=component.name,
             )
@@ -255,7 +302,7 @@ class ComponentManager:
                 f"Component {new_name} in file {new_file} is attempting to "
                 f"set the configuration value {e.value_name}, but it has already "
                 f"been set by {old_name} in file {old_file}."
-            )
+            ) from e
         except ConfigurationError as e:
             new_name, new_file = component.name, self._get_file(component)
             raise ComponentConfigError(
@@ -264,7 +311,19 @@ class ComponentManager:
                 f"This happens if one component attempts to set a value at an interior "
                 f"configuration key or if it attempts to turn an interior key into a "
                 f"configuration value."
-            )
+            ) from e
+
+    def _freeze(self):
+        """Replaces the component type index with a read-only version.
+
+        Components may only be added during initialization, so the index
+        never changes again once setup is complete.
+
+        """
+        self._components_by_type = MappingProxyType(
+            {t: tuple(components) for t, components in self._components_by_type.items()}
+        )
+        self._frozen = True
 
     @staticmethod
     def _get_file(component):
@@ -278,22 +337,25 @@ class ComponentManager:
     @staticmethod
     def _flatten(components: List):
         out = []
-        components = components[::-1]
-        while components:
-            current = components.pop()
+
+        def _walk(current):
             if isinstance(current, (list, tuple)):
-                components.extend(current[::-1])
+                for c in current:
+                    _walk(c)
             else:
-                if hasattr(current, "sub_components"):
-                    components.extend(current.sub_components[::-1])
                 out.append(current)
+                for c in getattr(current, "sub_components", ()):
+                    _walk(c)
+
+        _walk(components)
         return out
 
     @staticmethod
     def _setup_components(builder: "Builder", components: OrderedComponentSet):
         for c in components:
-            if hasattr(c, "setup"):
-                c.setup(builder)
+            setup = getattr(c, "setup", None)
+            if setup is not None:
+                setup(builder)
 
     def __repr__(self):
         return "ComponentManager()"
@@ -344,13 +406,13 @@ class ComponentInterface:
         """
         return self._manager.get_components_by_type(component_type)
 
-    def list_components(self) -> Dict[str, Any]:
+    def list_components(self) -> Mapping[str, Any]:
         """Get a mapping of component names to components held by the manager.
 
         Returns
         -------
-        Dict[str, Any]
-            A dictionary mapping component names to components.
+        Mapping[str, Any]
+            A read-only mapping of component names to components.
 
         """
         return self._manager.list_components()
@@ -20,6 +20,7 @@ There are three steps to this process.
 3. Importing and instantiating the actual components
 
 """
+import functools
 from typing import Any, Dict, List, Tuple, Union
 
 from vivarium.config_tree import ConfigTree
@@ -126,7 +127,7 @@ def parse_component_config_to_list(
     """Helper function for parsing hierarchical component configuration into a
     flat list.
 
-    This function recursively walks the component configuration dictionary,
+    This function walks the component configuration dictionary depth first,
     treating it like a prefix tree and building the import path prefix. When it
     hits a list, it prepends the built prefix onto each item in the list. If the
     dictionary contains multiple lists, the prefix-prepended lists are concated
@@ -166,22 +167,24 @@ def parse_component_config_to_list(
     if not component_config:
         return []
 
-    def _process_level(level, prefix):
+    component_list = []
+    stack = [(component_config, ())]
+    while stack:
+        level, prefix = stack.pop()
         if not level:
             raise ParsingError(
-                f"Check your configuration. Component {prefix} should not be left empty with the header"
+                f"Check your configuration. Component {list(prefix)} should not be left empty with the header"
             )
 
         if isinstance(level, list):
-            return [".".join(prefix + [child]) for child in level]
-
-        component_list = []
-        for name, child in level.items():
-            component_list.extend(_process_level(child, prefix + [name]))
-
-        return component_list
+            component_list.extend(".".join(prefix + (child,)) for child in level)
+        else:
+            # Push in reverse so levels are processed in their given order.
+            stack.extend(
+                (child, prefix + (name,)) for name, child in reversed(list(level.items()))
+            )
 
-    return _process_level(component_config, [])
+    return component_list
 
 
 def prep_components(component_list: Union[List[str], Tuple[str]]) -> List[Tuple[str, Tuple]]:
@@ -198,12 +201,21 @@ def prep_components(component_list: Union[List[str], Tuple[str]]) -> List[Tuple[
     List[Tuple[str, Tuple]]
         List of component/argument tuples.
     """
-    components = []
-    for c in component_list:
-        path, args_plus = c.split("(")
-        cleaned_args = clean_args(args_plus[:-1].split(","), path)
-        components.append((path, cleaned_args))
-    return components
+    return [_prep_component(c) for c in component_list]
+
+
+@functools.lru_cache(maxsize=256)
+def _prep_component(description: str) -> Tuple[str, Tuple]:
+    """Transform a single component description string into a tuple of the
+    component path and its arguments.
+
+    The result is immutable, so descriptions repeated across model
+    specifications are only parsed once.
+
+    """
+    path, args_plus = description.split("(")
+    cleaned_args = clean_args(args_plus[:-1].split(","), path)
+    return path, cleaned_args
 
 
 def clean_args(args: List, path: str) -> Tuple:
@@ -256,4 +268,12 @@ def import_and_instantiate_components(component_list: List[Tuple[str, Tuple[str]
         A list of instantiated component objects.
 
     """
-    return [import_by_path(component)(*args) for component, args in component_list]
+    # Specifications often repeat a component with different arguments, so
+    # resolve each import path once per call.
+    imported = {}
+    components = []
+    for component, args in component_list:
+        if component not in imported:
+            imported[component] = import_by_path(component)
+        components.append(imported[component](*args))
+    return components
@@ -11,9 +11,7 @@ representations of :term:`model specifications <Model Specification>` and
 from pathlib import Path
 from typing import Dict, Union
 
-import yaml
-
-from vivarium.config_tree import ConfigTree, ConfigurationError
+from vivarium.config_tree import ConfigTree, ConfigurationError, load_yaml
 from vivarium.framework.plugins import DEFAULT_PLUGINS
 
 
@@ -24,8 +22,9 @@ def build_model_specification(
     plugin_configuration: Union[Dict, ConfigTree] = None,
 ) -> ConfigTree:
     if isinstance(model_specification, (str, Path)):
-        validate_model_specification_file(model_specification)
         source = str(model_specification)
+        # Validation parses the file, so reuse its contents rather than reading it again.
+        model_specification = validate_model_specification_file(model_specification)
     else:
         source = "user_supplied_args"
 
@@ -44,8 +43,8 @@ def build_model_specification(
     return output_spec
 
 
-def validate_model_specification_file(file_path: Union[str, Path]) -> None:
-    """Ensures the provided file is a yaml file"""
+def validate_model_specification_file(file_path: Union[str, Path]) -> Dict:
+    """Ensures the provided file is a yaml file and returns its contents."""
     file_path = Path(file_path)
     if not file_path.exists():
         raise ConfigurationError(
@@ -60,8 +59,7 @@ def validate_model_specification_file(file_path: Union[str, Path]) -> None:
             value_name=None,
         )
     # Attempt to load
-    with file_path.open() as f:
-        raw_spec = yaml.full_load(f)
+    raw_spec = load_yaml(file_path)
     top_keys = set(raw_spec.keys())
     valid_keys = {"plugins", "components", "configuration"}
     if not top_keys <= valid_keys:
@@ -70,6 +68,7 @@ def validate_model_specification_file(file_path: Union[str, Path]) -> None:
             f"keys {valid_keys.difference(top_keys)}.",
             value_name=None,
         )
+    return raw_spec
 
 
 def build_simulation_configuration() -> ConfigTree:
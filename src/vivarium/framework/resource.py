@@ -16,10 +16,11 @@ and in turn ask for ordered sequences of these resources according to their
 dependencies or raise exceptions if this is not possible.
 
 """
+import sys
+from collections import deque
 from types import MethodType
-from typing import Any, Callable, Iterable, List
+from typing import Any, Callable, Dict, Iterable, List, Tuple
 
-import networkx as nx
 from loguru import logger
 
 from vivarium.exceptions import VivariumError
@@ -31,14 +32,16 @@ class ResourceError(VivariumError):
     pass
 
 
-RESOURCE_TYPES = {
-    "value",
-    "value_source",
-    "missing_value_source",
-    "value_modifier",
-    "column",
-    "stream",
-}
+RESOURCE_TYPES = frozenset(
+    {
+        "value",
+        "value_source",
+        "missing_value_source",
+        "value_modifier",
+        "column",
+        "stream",
+    }
+)
 NULL_RESOURCE_TYPE = "null"
 
 
@@ -54,6 +57,8 @@ class ResourceGroup:
 
     """
 
+    __slots__ = ("_resource_type", "_names", "_producer", "_dependencies")
+
     def __init__(
         self,
         resource_type: str,
@@ -62,7 +67,9 @@ class ResourceGroup:
         dependencies: List[str],
     ):
         self._resource_type = resource_type
-        self._resource_names = resource_names
+        # Resource keys are built at runtime, so intern them to speed up the
+        # dictionary probes made while building the resource graph.
+        self._names = tuple(sys.intern(f"{resource_type}.{name}") for name in resource_names)
         self._producer = producer
         self._dependencies = dependencies
 
@@ -76,9 +83,9 @@ class ResourceGroup:
         return self._resource_type
 
     @property
-    def names(self) -> List[str]:
+    def names(self) -> Tuple[str, ...]:
         """The long names (including type) of all resources in this group."""
-        return [f"{self._resource_type}.{name}" for name in self._resource_names]
+        return self._names
 
     @property
     def producer(self) -> Any:
@@ -110,6 +117,9 @@ class ResourceManager:
         # and the resource group they belong to. This is a one to many mapping
         # as some resource groups contain many resources.
         self._resource_group_map = {}
+        # The distinct resource groups in registration order, so consumers
+        # don't need to deduplicate the values of the map above.
+        self._resource_groups = []
         # null producers are those that don't produce any resources externally
         # but still consume other resources (i.e., have dependencies) - these
         # are only pop initializers as of 9/26/2019. Tracker is here to assign
@@ -119,6 +129,8 @@ class ResourceManager:
         self._graph = None
         # Attribute used for lazy (but cached) graph topo sort.
         self._sorted_nodes = None
+        # Attribute used for lazy (but cached) population initializer order.
+        self._initializers = None
 
     @property
     def name(self) -> str:
@@ -126,14 +138,20 @@ class ResourceManager:
         return "resource_manager"
 
     @property
-    def graph(self) -> nx.DiGraph:
-        """The networkx graph representation of the resource pool."""
+    def graph(self) -> Dict[ResourceGroup, Dict[ResourceGroup, None]]:
+        """The graph representation of the resource pool.
+
+        The graph is stored as an adjacency mapping from each resource group
+        to an insertion-ordered dict whose keys are the resource groups that
+        depend on it.
+
+        """
         if self._graph is None:
             self._graph = self._to_graph()
         return self._graph
 
     @property
-    def sorted_nodes(self):
+    def sorted_nodes(self) -> List[ResourceGroup]:
         """Returns a topological sort of the resource graph.
 
         Notes
@@ -143,13 +161,31 @@ class ResourceManager:
 
         """
         if self._sorted_nodes is None:
-            try:
-                self._sorted_nodes = list(nx.algorithms.topological_sort(self.graph))
-            except nx.NetworkXUnfeasible:
+            graph = self.graph
+            # Kahn's algorithm: repeatedly emit nodes with no unsorted
+            # dependencies.
+            in_degree = {node: 0 for node in graph}
+            for dependents in graph.values():
+                for dependent in dependents:
+                    in_degree[dependent] += 1
+
+            ready = deque(node for node, degree in in_degree.items() if not degree)
+            sorted_nodes = []
+            while ready:
+                node = ready.popleft()
+                sorted_nodes.append(node)
+                for dependent in graph[node]:
+                    in_degree[dependent] -= 1
+                    if not in_degree[dependent]:
+                        ready.append(dependent)
+
+            if len(sorted_nodes) < len(graph):
+                unsorted = [node for node, degree in in_degree.items() if degree]
                 raise ResourceError(
                     f"The resource pool contains at least one cycle: "
-                    f"{nx.find_cycle(self.graph)}."
+                    f"{self._find_cycle(graph, unsorted)}."
                 )
+            self._sorted_nodes = sorted_nodes
         return self._sorted_nodes
 
     def add_resources(
@@ -200,6 +236,12 @@ class ResourceManager:
                     f"producers for {resource}."
                 )
             self._resource_group_map[resource] = resource_group
+        self._resource_groups.append(resource_group)
+
+        # New resources invalidate any previously computed ordering.
+        self._graph = None
+        self._sorted_nodes = None
+        self._initializers = None
 
     def _get_resource_group(
         self,
@@ -225,7 +267,7 @@ class ResourceManager:
 
         return ResourceGroup(resource_type, resource_names, producer, dependencies)
 
-    def _to_graph(self) -> nx.DiGraph:
+    def _to_graph(self) -> Dict[ResourceGroup, Dict[ResourceGroup, None]]:
         """Constructs the full resource graph from information in the groups.
 
         Components specify local dependency information during setup time.
@@ -241,13 +283,13 @@ class ResourceManager:
         dependencies and population creation time.
 
         """
-        resource_graph = nx.DiGraph()
-        # networkx ignores duplicates
-        resource_graph.add_nodes_from(self._resource_group_map.values())
+        resource_graph = {resource_group: {} for resource_group in self._resource_groups}
 
-        for resource_group in resource_graph.nodes:
+        resource_group_map = self._resource_group_map
+        for resource_group in self._resource_groups:
             for dependency in resource_group.dependencies:
-                if dependency not in self._resource_group_map:
+                dependency_group = resource_group_map.get(dependency)
+                if dependency_group is None:
                     # Warn here because this sometimes happens naturally
                     # if observer components are missing from a simulation.
                     logger.warning(
@@ -255,11 +297,38 @@ class ResourceManager:
                         f"compute {resource_group}."
                     )
                     continue
-                dependency_group = self._resource_group_map[dependency]
-                resource_graph.add_edge(dependency_group, resource_group)
+                resource_graph[dependency_group][resource_group] = None
 
         return resource_graph
 
+    @staticmethod
+    def _find_cycle(
+        graph: Dict[ResourceGroup, Dict[ResourceGroup, None]],
+        unsorted: List[ResourceGroup],
+    ) -> List[Tuple[ResourceGroup, ResourceGroup]]:
+        """Finds a cycle among the nodes a topological sort could not place.
+
+        Every unsorted node has at least one unsorted dependency, so walking
+        backwards along those dependencies must eventually revisit a node.
+
+        """
+        remaining = set(unsorted)
+        dependencies = {node: [] for node in unsorted}
+        for node in unsorted:
+            for dependent in graph[node]:
+                if dependent in remaining:
+                    dependencies[dependent].append(node)
+
+        path, position = [], {}
+        node = unsorted[0]
+        while node not in position:
+            position[node] = len(path)
+            path.append(node)
+            node = dependencies[node][0]
+
+        cycle = path[position[node] :][::-1]
+        return list(zip(cycle, cycle[1:] + cycle[:1]))
+
     def __iter__(self) -> Iterable[MethodType]:
         """Returns a dependency-sorted iterable of population initializers.
 
@@ -268,20 +337,22 @@ class ResourceManager:
         creation time.
 
         """
-        return iter(
-            [
+        if self._initializers is None:
+            self._initializers = [
                 r.producer
                 for r in self.sorted_nodes
                 if r.type in {"column", NULL_RESOURCE_TYPE}
             ]
-        )
+        return iter(self._initializers)
 
     def __repr__(self):
-        out = {}
-        for resource_group in set(self._resource_group_map.values()):
-            produced = ", ".join(resource_group)
-            out[produced] = ", ".join(resource_group.dependencies)
-        return "\n".join([f"{produced} : {depends}" for produced, depends in out.items()])
+        def _lines():
+            for resource_group in self._resource_groups:
+                produced = ", ".join(resource_group)
+                depends = ", ".join(resource_group.dependencies)
+                yield f"{produced} : {depends}"
+
+        return "\n".join(_lines())
 
 
 class ResourceInterface:
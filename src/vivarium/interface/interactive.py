@@ -13,7 +13,7 @@ See the associated tutorials for :ref:`running <interactive_tutorial>` and
 
 """
 from math import ceil
-from typing import Any, Callable, Dict, List
+from typing import Any, Callable, List, Mapping
 
 import pandas as pd
 
@@ -216,13 +216,13 @@ class InteractiveContext(SimulationContext):
             raise ValueError(f"No event {event_type} in system.")
         return self._events.get_emitter(event_type)
 
-    def list_components(self) -> Dict[str, Any]:
+    def list_components(self) -> Mapping[str, Any]:
         """Get a mapping of component names to components currently in the simulation.
 
         Returns
         -------
-        Dict[str, Any]
-            A dictionary mapping component names to components.
+        Mapping[str, Any]
+            A read-only mapping of component names to components.
 
         """
         return self._component_manager.list_components()
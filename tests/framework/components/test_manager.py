@@ -1,3 +1,5 @@
+from abc import ABC
+
 import pytest
 
 from vivarium.framework.components.manager import (
@@ -65,6 +67,22 @@ def test_ComponentSet_pop():
         component_list.pop()
 
 
+def test_ComponentSet_get_by_name():
+    component_0 = MockComponentA(name="component_0")
+    component_list = OrderedComponentSet(component_0)
+    by_name = component_list.by_name
+
+    assert component_list.get("component_0") is component_0
+    with pytest.raises(KeyError):
+        component_list.get("component_1")
+
+    component_1 = MockComponentA(name="component_1")
+    component_list.add(component_1)
+    assert dict(by_name) == {"component_0": component_0, "component_1": component_1}
+    with pytest.raises(TypeError):
+        by_name["component_2"] = MockComponentA(name="component_2")
+
+
 def test_ComponentSet_contains():
     component_list = OrderedComponentSet()
 
@@ -217,6 +235,16 @@ def test_apply_configuration_defaults_no_op():
     assert config.to_dict() == c
 
 
+def test_apply_configuration_defaults_empty(mocker):
+    cm = ComponentManager()
+    cm.configuration = mocker.Mock()
+    component = MockComponentA()
+    component.configuration_defaults = {}
+
+    cm.apply_configuration_defaults(component)
+    cm.configuration.update.assert_not_called()
+
+
 def test_apply_configuration_defaults_duplicate():
     config = build_simulation_configuration()
     c = config.to_dict()
@@ -263,6 +291,84 @@ def test_add_components():
     assert cm.list_components() == {c.name: c for c in components}
 
 
+def test_get_components_by_type():
+    config = build_simulation_configuration()
+    cm = ComponentManager()
+    cm.configuration = config
+    components = [
+        MockComponentA("a_0", name="a_0"),
+        MockComponentB(name="b_0"),
+        MockComponentA("a_1", name="a_1"),
+    ]
+    cm.add_components(components)
+
+    assert cm.get_components_by_type(MockComponentA) == [components[0], components[2]]
+    assert cm.get_components_by_type(MockComponentB) == [components[1]]
+    assert cm.get_components_by_type((MockComponentA, MockComponentB)) == components
+    assert cm.get_components_by_type(object) == components
+    assert cm.get_components_by_type(MockGenericComponent) == []
+
+    class Base(ABC):
+        pass
+
+    class A(Base):
+        name = "a"
+
+    class B:
+        name = "b"
+
+    Base.register(B)
+
+    config = build_simulation_configuration()
+    cm = ComponentManager()
+    cm.configuration = config
+    a, b = A(), B()
+    cm.add_components([a, b])
+
+    assert cm.get_components_by_type(Base) == [a, b]
+
+
+def test_get_components_by_type_after_setup(mocker):
+    config = build_simulation_configuration()
+    cm = ComponentManager()
+    cm.configuration = config
+    components = [MockComponentA(name="a_0"), MockComponentB(name="b_0")]
+    cm.add_components(components)
+    cm.setup_components(mocker.Mock())
+
+    assert cm.get_components_by_type(MockComponentA) == [components[0]]
+    assert cm.get_components_by_type(MockComponentB) == [components[1]]
+    assert cm.get_components_by_type((MockComponentA, MockComponentB)) == components
+    assert cm.get_components_by_type(MockGenericComponent) == []
+
+
+def test_add_components_after_setup(mocker):
+    config = build_simulation_configuration()
+    cm = ComponentManager()
+    cm.configuration = config
+    components = [MockComponentA(name="a_0")]
+    cm.add_components(components)
+    cm.setup_components(mocker.Mock())
+
+    with pytest.raises(ComponentConfigError, match="after the component manager"):
+        cm.add_components([MockComponentA(name="a_1")])
+    assert cm._components == OrderedComponentSet(*components)
+    assert cm.get_components_by_type(MockComponentA) == components
+
+
+def test_get_component():
+    config = build_simulation_configuration()
+    cm = ComponentManager()
+    cm.configuration = config
+    components = [MockGenericComponent(f"component_{i}") for i in range(5)]
+    cm.add_components(components)
+
+    for c in components:
+        assert cm.get_component(c.name) is c
+    with pytest.raises(ValueError, match="No component found"):
+        cm.get_component("absent")
+
+
 @pytest.mark.parametrize(
     "components",
     ([MockComponentA("Eric"), MockComponentB("half", "a", "bee")], [MockComponentA("Eric")]),
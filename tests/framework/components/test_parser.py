@@ -131,6 +131,21 @@ def test_import_and_instantiate_components(monkeypatch):
     assert component_list[1].args == ("Ethel the Aardvark goes Quantity Surveying",)
 
 
+def test_import_and_instantiate_components_repeated_path(mocker):
+    importer = mocker.patch(
+        "vivarium.framework.components.parser.import_by_path", side_effect=mock_importer
+    )
+
+    component_descriptions = [
+        ("test_components.MockComponentA", ("Spam",)),
+        ("test_components.MockComponentA", ("Eggs",)),
+    ]
+    component_list = import_and_instantiate_components(component_descriptions)
+
+    importer.assert_called_once_with("test_components.MockComponentA")
+    assert [c.args for c in component_list] == [("Spam",), ("Eggs",)]
+
+
 def test_ComponentConfigurationParser_get_components(import_and_instantiate_mock, components):
     config = build_simulation_configuration()
     config.update(components)
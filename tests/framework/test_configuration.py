@@ -1,6 +1,9 @@
+from pathlib import Path
+
 import pytest
 import yaml
 
+from vivarium.config_tree import load_yaml
 from vivarium.framework.configuration import (
     DEFAULT_PLUGINS,
     ConfigurationError,
@@ -54,7 +57,7 @@ def test_validate_model_specification_failures(mocker, test_data_dir, test_spec)
     with test_spec.open() as f:
         spec_dict = yaml.full_load(f)
     spec_dict.update({"invalid_key": "some_value"})
-    load_mock = mocker.patch("vivarium.framework.configuration.yaml.full_load")
+    load_mock = mocker.patch("vivarium.framework.configuration.load_yaml")
     load_mock.return_value = spec_dict
     with pytest.raises(ConfigurationError):
         validate_model_specification_file(test_spec)
@@ -89,7 +92,7 @@ def test_build_model_specification_failure(mocker, test_data_dir, test_spec):
     with test_spec.open() as f:
         spec_dict = yaml.full_load(f)
     spec_dict.update({"invalid_key": "some_value"})
-    load_mock = mocker.patch("vivarium.framework.configuration.yaml.full_load")
+    load_mock = mocker.patch("vivarium.framework.configuration.load_yaml")
     load_mock.return_value = spec_dict
     with pytest.raises(ConfigurationError):
         build_model_specification(str(test_spec))
@@ -113,3 +116,15 @@ def test_build_model_specification(mocker, test_spec, test_user_config):
     test_data["configuration"].update(user_data)
 
     assert loaded_model_spec.to_dict() == test_data
+
+
+def test_build_model_specification_loads_file_once(mocker, test_spec, test_user_config):
+    expand_user_mock = mocker.patch("vivarium.framework.configuration.Path.expanduser")
+    expand_user_mock.return_value = test_user_config
+    load_mock = mocker.patch(
+        "vivarium.framework.configuration.load_yaml", side_effect=load_yaml
+    )
+
+    build_model_specification(test_spec)
+
+    load_mock.assert_called_once_with(Path(test_spec))
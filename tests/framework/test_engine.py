@@ -34,12 +34,33 @@ def components():
     ]
 
 
+@pytest.fixture
+def listener(components):
+    return next(c for c in components if "listener" in c.args)
+
+
+@pytest.fixture
+def unpacked_components(components):
+    unpacked = []
+    for c in components:
+        unpacked.append(c)
+        unpacked.extend(getattr(c, "sub_components", ()))
+    return unpacked
+
+
+@pytest.fixture
+def sim(base_config, components):
+    sim = SimulationContext(base_config, components)
+    sim.setup()
+    return sim
+
+
 @pytest.fixture
 def log(mocker):
     return mocker.patch("vivarium.framework.engine.logger")
 
 
-def test_SimulationContext_init_default(components):
+def test_SimulationContext_init_default(components, unpacked_components):
     sim = SimulationContext(components=components)
 
     assert isinstance(sim._lifecycle, LifeCycleManager)
@@ -94,29 +115,18 @@ def test_SimulationContext_init_default(components):
         sim._results,
     ]
     assert sim._component_manager._managers == OrderedComponentSet(*managers)
-    unpacked_components = []
-    for c in components:
-        unpacked_components.append(c)
-        if hasattr(c, "sub_components"):
-            unpacked_components.extend(c.sub_components)
     assert list(sim._component_manager._components)[:-1] == unpacked_components
-    assert isinstance(list(sim._component_manager._components)[-1], Metrics)
+    assert isinstance(sim._component_manager._components[-1], Metrics)
 
 
-def test_SimulationContext_setup_default(base_config, components):
+def test_SimulationContext_setup_default(
+    base_config, components, unpacked_components, listener
+):
     sim = SimulationContext(base_config, components)
-    listener = [c for c in components if "listener" in c.args][0]
     assert not listener.post_setup_called
     sim.setup()
 
-    unpacked_components = []
-    for c in components:
-        unpacked_components.append(c)
-        if hasattr(c, "sub_components"):
-            unpacked_components.extend(c.sub_components)
-    unpacked_components.append(Metrics())
-
-    for a, b in zip(sim._component_manager._components, unpacked_components):
+    for a, b in zip(sim._component_manager._components, unpacked_components + [Metrics()]):
         assert type(a) == type(b)
         if hasattr(a, "args"):
             assert a.args == b.args
@@ -140,9 +150,7 @@ def test_SimulationContext_setup_default(base_config, components):
     assert listener.post_setup_called
 
 
-def test_SimulationContext_initialize_simulants(base_config, components):
-    sim = SimulationContext(base_config, components)
-    sim.setup()
+def test_SimulationContext_initialize_simulants(sim):
     pop_size = sim.configuration.population.population_size
     current_time = sim._clock.time
     assert sim._population.get_population(True).empty
@@ -151,16 +159,12 @@ def test_SimulationContext_initialize_simulants(base_config, components):
     assert sim._clock.time == current_time
 
 
-def test_SimulationContext_step(log, base_config, components):
-    sim = SimulationContext(base_config, components)
-    sim.setup()
+def test_SimulationContext_step(log, sim, listener):
     sim.initialize_simulants()
 
     current_time = sim._clock.time
     step_size = sim._clock.step_size
 
-    listener = [c for c in components if "listener" in c.args][0]
-
     assert not listener.time_step__prepare_called
     assert not listener.time_step_called
     assert not listener.time_step__cleanup_called
@@ -177,10 +181,7 @@ def test_SimulationContext_step(log, base_config, components):
     assert sim._clock.time == current_time + step_size
 
 
-def test_SimulationContext_finalize(base_config, components):
-    sim = SimulationContext(base_config, components)
-    listener = [c for c in components if "listener" in c.args][0]
-    sim.setup()
+def test_SimulationContext_finalize(sim, listener):
     sim.initialize_simulants()
     sim.step()
     assert not listener.simulation_end_called
@@ -188,9 +189,7 @@ def test_SimulationContext_finalize(base_config, components):
     assert listener.simulation_end_called
 
 
-def test_SimulationContext_report(base_config, components):
-    sim = SimulationContext(base_config, components)
-    sim.setup()
+def test_SimulationContext_report(sim):
     sim.initialize_simulants()
     sim.run()
     sim.finalize()
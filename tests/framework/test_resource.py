@@ -1,4 +1,4 @@
-import networkx as nx
+import numpy as np
 import pytest
 
 from vivarium.framework.resource import (
@@ -28,10 +28,25 @@ def test_resource_group():
     rg = ResourceGroup(r_type, r_names, r_producer, r_dependencies)
 
     assert rg.type == r_type
-    assert rg.names == [f"{r_type}.{name}" for name in r_names]
+    assert rg.names == tuple(f"{r_type}.{name}" for name in r_names)
     assert rg.producer == c.producer
     assert not rg.dependencies
-    assert list(rg) == rg.names
+    assert tuple(rg) == rg.names
+
+
+def test_resource_group_non_string_names():
+    c = Component("base")
+    rg = ResourceGroup("column", [0, 1], c.producer, [])
+
+    assert rg.names == ("column.0", "column.1")
+
+
+def test_resource_group_str_subclass_dependencies():
+    c = Component("base")
+    dependencies = list(np.array(["value.x"]))
+    rg = ResourceGroup("column", ["a"], c.producer, dependencies)
+
+    assert rg.dependencies == ["value.x"]
 
 
 def test_resource_manager_get_resource_group():
@@ -45,10 +60,10 @@ def test_resource_manager_get_resource_group():
     rg = rm._get_resource_group(r_type, r_names, r_producer, r_dependencies)
 
     assert rg.type == r_type
-    assert rg.names == [f"{r_type}.{name}" for name in r_names]
+    assert rg.names == tuple(f"{r_type}.{name}" for name in r_names)
     assert rg.producer == c.producer
     assert not rg.dependencies
-    assert list(rg) == rg.names
+    assert tuple(rg) == rg.names
 
 
 def test_resource_manager_get_resource_group_null():
@@ -62,10 +77,10 @@ def test_resource_manager_get_resource_group_null():
     rg = rm._get_resource_group(r_type, r_names, r_producer, r_dependencies)
 
     assert rg.type == NULL_RESOURCE_TYPE
-    assert rg.names == [f"{NULL_RESOURCE_TYPE}.0"]
+    assert rg.names == (f"{NULL_RESOURCE_TYPE}.0",)
     assert rg.producer == c.producer
     assert not rg.dependencies
-    assert list(rg) == rg.names
+    assert tuple(rg) == rg.names
 
 
 def test_resource_manager_add_resources_bad_type():